@@ -1,5 +1,130 @@
 import math
 import numpy as np
+from collections import namedtuple
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional - fall back to the pure-Python kernel
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+# Integer gesture codes returned by the compiled kernel
+GESTURE_CODE_NONE = 0
+GESTURE_CODE_WRITING = 1
+GESTURE_CODE_STOP = 2
+GESTURE_CODE_SPACE = 3
+GESTURE_CODE_CLEAR = 4
+
+# Fixed-point landmark scale: normalized [0, 1] coordinates only carry
+# ~3 usable decimal digits, so int16 at this scale loses nothing while
+# halving bytes and keeping the kernel in integer SIMD territory
+FIXED_POINT_SCALE = 32767
+_THUMB_EXTENDED_THRESHOLD_SQ = int(0.01 * FIXED_POINT_SCALE**2)   # 0.1 squared
+_PINCH_THRESHOLD_SQ = int(0.0025 * FIXED_POINT_SCALE**2)          # 0.05 squared
+
+# Immutable gesture snapshot - cached and only rebuilt when a field
+# actually changes, so steady-state polling allocates nothing
+GestureInfo = namedtuple('GestureInfo', ['gesture', 'previous', 'confidence'])
+
+
+def _build_gesture_table():
+    """
+    Precompute the gesture for every finger-state bitmask
+
+    The mask packs (pinch, thumb, pinky, ring, middle, index) into 6
+    bits, so classification in the kernel is a single table load
+    instead of a chain of branches.
+    """
+    table = np.empty(64, dtype=np.uint8)
+
+    for mask in range(64):
+        index_ext = bool(mask & 1)
+        middle_ext = bool(mask & 2)
+        ring_ext = bool(mask & 4)
+        pinky_ext = bool(mask & 8)
+        thumb_ext = bool(mask & 16)
+        pinch = bool(mask & 32)
+
+        if pinch and not ring_ext and not pinky_ext:
+            table[mask] = GESTURE_CODE_CLEAR
+        elif index_ext and middle_ext and not ring_ext and not pinky_ext:
+            table[mask] = GESTURE_CODE_SPACE
+        elif index_ext and not middle_ext and not ring_ext and not pinky_ext:
+            table[mask] = GESTURE_CODE_WRITING
+        elif not (index_ext or middle_ext or ring_ext or pinky_ext
+                  or thumb_ext):  # fist: no fingers and no thumb
+            table[mask] = GESTURE_CODE_STOP
+        else:
+            table[mask] = GESTURE_CODE_NONE
+
+    return table
+
+
+@njit(cache=True)
+def _gesture_kernel(lm, table):
+    """
+    Classify the gesture from a (21, 3) int16 fixed-point landmark array
+
+    Pure integer arithmetic (widened to int64 before squaring) so Numba
+    can compile it to native code; the finger states index the
+    precomputed gesture table, so dispatch is branchless regardless of
+    how the user transitions between gestures. Returns one of the
+    GESTURE_CODE_* integers.
+    """
+    wx = np.int64(lm[0, 0])
+    wy = np.int64(lm[0, 1])
+
+    # Finger extension: squared tip-to-wrist vs squared mcp-to-wrist.
+    # The 0.9 ratio becomes the integer comparison 100*tip > 81*mcp.
+    dx = np.int64(lm[8, 0]) - wx
+    dy = np.int64(lm[8, 1]) - wy
+    mx = np.int64(lm[5, 0]) - wx
+    my = np.int64(lm[5, 1]) - wy
+    index_ext = 100 * (dx * dx + dy * dy) > 81 * (mx * mx + my * my)
+
+    dx = np.int64(lm[12, 0]) - wx
+    dy = np.int64(lm[12, 1]) - wy
+    mx = np.int64(lm[9, 0]) - wx
+    my = np.int64(lm[9, 1]) - wy
+    middle_ext = 100 * (dx * dx + dy * dy) > 81 * (mx * mx + my * my)
+
+    dx = np.int64(lm[16, 0]) - wx
+    dy = np.int64(lm[16, 1]) - wy
+    mx = np.int64(lm[13, 0]) - wx
+    my = np.int64(lm[13, 1]) - wy
+    ring_ext = 100 * (dx * dx + dy * dy) > 81 * (mx * mx + my * my)
+
+    dx = np.int64(lm[20, 0]) - wx
+    dy = np.int64(lm[20, 1]) - wy
+    mx = np.int64(lm[17, 0]) - wx
+    my = np.int64(lm[17, 1]) - wy
+    pinky_ext = 100 * (dx * dx + dy * dy) > 81 * (mx * mx + my * my)
+
+    # Thumb extended if far from index finger base
+    dx = np.int64(lm[4, 0]) - lm[5, 0]
+    dy = np.int64(lm[4, 1]) - lm[5, 1]
+    thumb_ext = dx * dx + dy * dy > _THUMB_EXTENDED_THRESHOLD_SQ
+
+    # Thumb and index pinch (close together)
+    dx = np.int64(lm[4, 0]) - lm[8, 0]
+    dy = np.int64(lm[4, 1]) - lm[8, 1]
+    pinch = dx * dx + dy * dy < _PINCH_THRESHOLD_SQ
+
+    # Pack finger states into a 6-bit mask and look the gesture up
+    mask = (
+        (1 if index_ext else 0)
+        | (2 if middle_ext else 0)
+        | (4 if ring_ext else 0)
+        | (8 if pinky_ext else 0)
+        | (16 if thumb_ext else 0)
+        | (32 if pinch else 0)
+    )
+
+    return table[mask]
+
 
 class GestureRecognizer:
     """Recognizes hand gestures for air writing control"""
@@ -10,7 +135,13 @@ class GestureRecognizer:
     GESTURE_STOP = "stop"  # Fist closed
     GESTURE_SPACE = "space"  # Two fingers up (index + middle)
     GESTURE_CLEAR = "clear"  # Thumb + index pinch
-    
+
+    # Kernel gesture code -> gesture name
+    GESTURE_BY_CODE = (
+        GESTURE_NONE, GESTURE_WRITING, GESTURE_STOP, GESTURE_SPACE, GESTURE_CLEAR
+    )
+
+
     def __init__(self, gesture_hold_frames=5):
         """
         Initialize gesture recognizer
@@ -23,7 +154,20 @@ class GestureRecognizer:
         self.gesture_hold_frames = gesture_hold_frames
         self.gesture_frame_count = 0
         self.confirmed_gesture = self.GESTURE_NONE
-        
+
+        # Integer codes mirror the string attributes so the per-frame
+        # comparisons in update_gesture are int == int
+        self._current_code = GESTURE_CODE_NONE
+        self._previous_code = GESTURE_CODE_NONE
+        self._confirmed_code = GESTURE_CODE_NONE
+
+        # Precomputed reciprocal turns the per-frame confidence divide
+        # into a multiply
+        self._inv_hold = 1.0 / gesture_hold_frames
+        self._confidence = 0.0
+        self._info = GestureInfo(self.GESTURE_NONE, self.GESTURE_NONE, 0.0)
+
+
         # MediaPipe landmark indices
         self.WRIST = 0
         self.THUMB_TIP = 4
@@ -35,6 +179,51 @@ class GestureRecognizer:
         self.RING_MCP = 13
         self.PINKY_TIP = 20
         self.PINKY_MCP = 17
+
+        # Vectorized landmark extraction (index/middle/ring/pinky)
+        self._tip_ids = np.array([8, 12, 16, 20])
+        self._mcp_ids = np.array([5, 9, 13, 17])
+        self._landmark_buf = np.empty((21, 3), dtype=np.float32)
+
+        # Fixed-point quantization buffers: landmarks are scaled to
+        # int16 once per frame and all gesture math runs on integers
+        self._scaled_buf = np.empty((21, 3), dtype=np.float32)
+        self._quantized_buf = np.empty((21, 3), dtype=np.int16)
+
+        # Precomputed mask -> gesture lookup; new gestures are added by
+        # editing the table builder, not a branch chain
+        self._gesture_table = _build_gesture_table()
+
+        # Warm up the (possibly jitted) gesture kernel so the one-time
+        # compile cost is paid at startup, not on the first frame
+        _gesture_kernel(np.zeros((21, 3), dtype=np.int16), self._gesture_table)
+
+    def _extract_landmarks(self, hand_landmarks):
+        """
+        Copy all 21 landmarks into the reusable buffers and quantize
+
+        Accepts either MediaPipe landmarks (walked in one protobuf
+        pass) or an already-extracted (21, 3) array, e.g. the one
+        HandDetector caches per result - in that case the protobuf is
+        never touched here. The result is the int16 fixed-point view
+        the gesture kernel consumes.
+        """
+        if isinstance(hand_landmarks, np.ndarray):
+            buf = hand_landmarks
+        else:
+            buf = self._landmark_buf
+            for i, lm in enumerate(hand_landmarks.landmark):
+                buf[i, 0] = lm.x
+                buf[i, 1] = lm.y
+                buf[i, 2] = lm.z
+
+        # Quantize to int16 fixed-point (clip first - MediaPipe can
+        # report coordinates slightly outside [0, 1])
+        np.multiply(buf, FIXED_POINT_SCALE, out=self._scaled_buf)
+        np.clip(self._scaled_buf, -FIXED_POINT_SCALE, FIXED_POINT_SCALE,
+                out=self._scaled_buf)
+        self._quantized_buf[...] = self._scaled_buf
+        return self._quantized_buf
         
     def get_landmark_coords(self, hand_landmarks, landmark_id, frame_width, frame_height):
         """Get normalized and pixel coordinates of a landmark"""
@@ -45,36 +234,44 @@ class GestureRecognizer:
         
     def calculate_distance(self, point1, point2):
         """Calculate Euclidean distance between two points"""
-        return math.sqrt((point1[0] - point2[0])**2 + (point1[1] - point2[1])**2)
-        
+        # hypot is a single C call (and numerically stabler than the
+        # hand-written sqrt-of-squares form)
+        return math.hypot(point1[0] - point2[0], point1[1] - point2[1])
+
+    def _dist_sq(self, point1, point2):
+        """Squared Euclidean distance (avoids sqrt on the per-frame hot path)"""
+        return (point1[0] - point2[0])**2 + (point1[1] - point2[1])**2
+
     def is_finger_extended(self, hand_landmarks, tip_id, mcp_id, wrist_coords):
         """Check if a finger is extended"""
         tip = hand_landmarks.landmark[tip_id]
         mcp = hand_landmarks.landmark[mcp_id]
-        
+
         # Finger is extended if tip is above MCP joint (lower y value)
         # and further from wrist
-        tip_to_wrist = self.calculate_distance(
+        # Compare squared distances - sqrt is monotonic so the result is
+        # identical, but we skip ~2 sqrt calls per finger per frame
+        tip_to_wrist_sq = self._dist_sq(
             (tip.x, tip.y), (wrist_coords[0], wrist_coords[1])
         )
-        mcp_to_wrist = self.calculate_distance(
+        mcp_to_wrist_sq = self._dist_sq(
             (mcp.x, mcp.y), (wrist_coords[0], wrist_coords[1])
         )
-        
-        return tip_to_wrist > mcp_to_wrist * 0.9
-        
+
+        return tip_to_wrist_sq > mcp_to_wrist_sq * 0.81  # 0.9 squared
+
     def is_thumb_extended(self, hand_landmarks):
         """Check if thumb is extended"""
         thumb_tip = hand_landmarks.landmark[self.THUMB_TIP]
         index_mcp = hand_landmarks.landmark[self.INDEX_MCP]
-        
+
         # Thumb is extended if it's far from index finger base
-        distance = self.calculate_distance(
+        distance_sq = self._dist_sq(
             (thumb_tip.x, thumb_tip.y),
             (index_mcp.x, index_mcp.y)
         )
-        
-        return distance > 0.1
+
+        return distance_sq > 0.01  # 0.1 squared
         
     def detect_gesture(self, hand_landmarks, frame_width, frame_height):
         """
@@ -83,95 +280,64 @@ class GestureRecognizer:
         Returns:
             str: Detected gesture name
         """
+        return self.GESTURE_BY_CODE[self._detect_code(hand_landmarks)]
+
+    def _detect_code(self, hand_landmarks):
+        """Classify the gesture and return its integer code"""
         if hand_landmarks is None:
-            return self.GESTURE_NONE
-            
-        # Get key landmarks
-        wrist = hand_landmarks.landmark[self.WRIST]
-        wrist_norm = (wrist.x, wrist.y, wrist.z)
-        
-        thumb_tip_px, thumb_tip = self.get_landmark_coords(
-            hand_landmarks, self.THUMB_TIP, frame_width, frame_height
-        )
-        index_tip_px, index_tip = self.get_landmark_coords(
-            hand_landmarks, self.INDEX_TIP, frame_width, frame_height
-        )
-        
-        # Check finger states
-        index_extended = self.is_finger_extended(
-            hand_landmarks, self.INDEX_TIP, self.INDEX_MCP, wrist_norm
-        )
-        middle_extended = self.is_finger_extended(
-            hand_landmarks, self.MIDDLE_TIP, self.MIDDLE_MCP, wrist_norm
-        )
-        ring_extended = self.is_finger_extended(
-            hand_landmarks, self.RING_TIP, self.RING_MCP, wrist_norm
-        )
-        pinky_extended = self.is_finger_extended(
-            hand_landmarks, self.PINKY_TIP, self.PINKY_MCP, wrist_norm
-        )
-        thumb_extended = self.is_thumb_extended(hand_landmarks)
-        
-        # Count extended fingers
-        extended_count = sum([
-            index_extended, middle_extended, ring_extended, pinky_extended
-        ])
-        
-        # Gesture 1: CLEAR - Thumb and index pinch (close together)
-        thumb_index_distance = self.calculate_distance(
-            (thumb_tip[0], thumb_tip[1]),
-            (index_tip[0], index_tip[1])
-        )
-        if thumb_index_distance < 0.05 and not ring_extended and not pinky_extended:
-            return self.GESTURE_CLEAR
-            
-        # Gesture 2: SPACE - Two fingers up (index + middle)
-        if index_extended and middle_extended and not ring_extended and not pinky_extended:
-            return self.GESTURE_SPACE
-            
-        # Gesture 3: WRITING - Only index finger up
-        if index_extended and not middle_extended and not ring_extended and not pinky_extended:
-            return self.GESTURE_WRITING
-            
-        # Gesture 4: STOP - Fist (no fingers extended)
-        if extended_count == 0 and not thumb_extended:
-            return self.GESTURE_STOP
-            
-        return self.GESTURE_NONE
-        
+            return GESTURE_CODE_NONE
+
+        # Extract all landmarks into a single array (one protobuf pass)
+        # and classify in the compiled kernel
+        landmarks = self._extract_landmarks(hand_landmarks)
+        return int(_gesture_kernel(landmarks, self._gesture_table))
+
     def update_gesture(self, hand_landmarks, frame_width, frame_height):
         """
         Update gesture state with temporal smoothing
-        
+
         Returns:
             tuple: (current_gesture, gesture_changed)
         """
-        detected_gesture = self.detect_gesture(hand_landmarks, frame_width, frame_height)
-        
+        # Fast path for the common idle case (hand left the frame):
+        # skip the classification call entirely
+        if hand_landmarks is None:
+            detected_code = GESTURE_CODE_NONE
+        else:
+            detected_code = self._detect_code(hand_landmarks)
+
         # Temporal smoothing - require gesture to be held for multiple frames
-        if detected_gesture == self.current_gesture:
+        if detected_code == self._current_code:
             self.gesture_frame_count += 1
         else:
-            self.current_gesture = detected_gesture
+            self._current_code = detected_code
+            self.current_gesture = self.GESTURE_BY_CODE[detected_code]
             self.gesture_frame_count = 1
-            
+
         # Confirm gesture if held long enough
         gesture_changed = False
         if self.gesture_frame_count >= self.gesture_hold_frames:
-            if self.confirmed_gesture != self.current_gesture:
+            if self._confirmed_code != self._current_code:
+                self._previous_code = self._confirmed_code
+                self._confirmed_code = self._current_code
                 self.previous_gesture = self.confirmed_gesture
                 self.confirmed_gesture = self.current_gesture
                 gesture_changed = True
-                
+
+        self._confidence = min(self.gesture_frame_count * self._inv_hold, 1.0)
+
+        # Refresh the cached snapshot only when something changed
+        if (gesture_changed or self._info.confidence != self._confidence
+                or self._info.gesture != self.confirmed_gesture):
+            self._info = GestureInfo(
+                self.confirmed_gesture, self.previous_gesture, self._confidence
+            )
+
         return self.confirmed_gesture, gesture_changed
-        
+
     def get_gesture_info(self):
-        """Get current gesture information"""
-        return {
-            'gesture': self.confirmed_gesture,
-            'previous': self.previous_gesture,
-            'confidence': min(self.gesture_frame_count / self.gesture_hold_frames, 1.0)
-        }
+        """Get current gesture information (cached, allocation-free)"""
+        return self._info
         
     def is_writing_active(self):
         """Check if writing mode is active"""
@@ -182,4 +348,9 @@ class GestureRecognizer:
         self.current_gesture = self.GESTURE_NONE
         self.confirmed_gesture = self.GESTURE_NONE
         self.previous_gesture = self.GESTURE_NONE
-        self.gesture_frame_count = 0
\ No newline at end of file
+        self.gesture_frame_count = 0
+        self._current_code = GESTURE_CODE_NONE
+        self._confirmed_code = GESTURE_CODE_NONE
+        self._previous_code = GESTURE_CODE_NONE
+        self._confidence = 0.0
+        self._info = GestureInfo(self.GESTURE_NONE, self.GESTURE_NONE, 0.0)
\ No newline at end of file
@@ -1,47 +1,280 @@
 import cv2
+import time
+import threading
+import numpy as np
 import mediapipe as mp
 from src.hand_tracking.landmark_utils import LandmarkUtils
 
+# Shared MediaPipe Hands graphs, keyed by construction parameters.
+# Building a Hands graph loads TFLite models (~100 ms), so detectors
+# created with the same settings share one refcounted instance.
+_HANDS_CACHE = {}
+
+
+def _acquire_hands(key):
+    """Get (or create) the shared Hands instance for these parameters"""
+    entry = _HANDS_CACHE.get(key)
+
+    if entry is None:
+        max_num_hands, det_conf, trk_conf, model_complexity = key
+        # static_image_mode=False keeps the tracker warm between frames
+        # (the palm detector only re-runs on tracking loss, ~3x cheaper)
+        hands = mp.solutions.hands.Hands(
+            static_image_mode=False,
+            max_num_hands=max_num_hands,
+            model_complexity=model_complexity,
+            min_detection_confidence=det_conf,
+            min_tracking_confidence=trk_conf
+        )
+        entry = [hands, 0]
+        _HANDS_CACHE[key] = entry
+
+    entry[1] += 1
+    return entry[0]
+
+
+def _release_hands(key):
+    """Drop one reference; close the graph when nobody uses it"""
+    entry = _HANDS_CACHE.get(key)
+
+    if entry is None:
+        return
+
+    entry[1] -= 1
+    if entry[1] <= 0:
+        del _HANDS_CACHE[key]
+        entry[0].close()
+
+
 class HandDetector:
     """Real-time hand detection and tracking using MediaPipe"""
-    
-    def __init__(self, min_detection_confidence=0.7, min_tracking_confidence=0.5, max_num_hands=1):
+
+    def __init__(self, min_detection_confidence=0.7, min_tracking_confidence=0.5,
+                 max_num_hands=1, use_async=True,
+                 inference_width=None, inference_height=None,
+                 motion_threshold=3000, model_complexity=0):
         """
         Initialize hand detector
-        
+
         Args:
             min_detection_confidence: Minimum confidence for hand detection
             min_tracking_confidence: Minimum confidence for hand tracking
             max_num_hands: Maximum number of hands to detect
+            use_async: Run inference on a worker thread so it overlaps
+                       camera capture and drawing (results lag one frame)
+            inference_width: Downscale frames to this width before
+                             inference (None = use full frame)
+            inference_height: Downscale frames to this height before
+                              inference (None = use full frame)
+            motion_threshold: L1 distance between 32x32 grayscale
+                              thumbnails below which inference is
+                              skipped (0 disables the motion gate)
+            model_complexity: MediaPipe model variant; 0 is the "lite"
+                              graph, roughly 2x faster than 1 ("full")
         """
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=max_num_hands,
-            min_detection_confidence=min_detection_confidence,
-            min_tracking_confidence=min_tracking_confidence
-        )
-        
+        self._hands_key = (max_num_hands, min_detection_confidence,
+                           min_tracking_confidence, model_complexity)
+        self.hands = _acquire_hands(self._hands_key)
+
+        # Warm-up inference: pay TFLite delegate init (tens of ms) here
+        # rather than on the first real frame
+        warmup_start = time.perf_counter()
+        self.hands.process(np.zeros((256, 256, 3), dtype=np.uint8))
+        print(f"[INFO] Hand model warm-up: "
+              f"{(time.perf_counter() - warmup_start) * 1000:.0f} ms")
+
         self.landmark_utils = LandmarkUtils()
         self.results = None
-        
+
+        # Landmark array cache: the protobuf is walked at most once per
+        # inference result, however many consumers query landmarks
+        self._landmark_array = None
+        self._landmark_array_src = None
+
+        # Async inference: a single-slot "latest frame" input and a
+        # last-completed-result output, so the main loop never blocks
+        # on hands.process()
+        self.use_async = use_async
+        self._lock = threading.Lock()
+        self._pending_frame = None
+        self._frame_ready = threading.Event()
+        self._running = False
+
+        # Preallocated RGB conversion buffers (lazy - sized on first
+        # frame). Two slots alternate so the inference thread can keep
+        # reading one while the next frame is converted into the other.
+        self._rgb_buffers = [None, None]
+        self._rgb_index = 0
+
+        # Optional inference downscaling - landmarks come back
+        # normalized to [0, 1], so consumers that multiply by the
+        # display frame size are unaffected
+        self.inference_width = inference_width
+        self.inference_height = inference_height
+        self._small_buffers = [None, None]
+        self._small_index = 0
+
+        # Motion gate: compare 32x32 grayscale thumbnails of successive
+        # frames and skip inference when nothing moved. At most one
+        # consecutive frame is skipped so results never go stale.
+        self.motion_threshold = motion_threshold
+        self._thumb = np.empty((32, 32), dtype=np.uint8)
+        self._prev_thumb = np.empty((32, 32), dtype=np.uint8)
+        self._have_prev_thumb = False
+        self._skipped_frames = 0
+        self._max_skip_frames = 1
+
+        # Idle gate: once no hand has been seen for a streak of frames,
+        # run the (expensive) palm detector on only every third frame
+        # until a hand reappears
+        self._frame_counter = 0
+        self._miss_streak = 0
+        self._idle_miss_threshold = 5
+        self._idle_skip_mod = 3
+
+        if self.use_async:
+            self._running = True
+            self._worker = threading.Thread(target=self._inference_loop, daemon=True)
+            self._worker.start()
+
+    def _inference_loop(self):
+        """Worker thread: run inference on the most recent submitted frame"""
+        while self._running:
+            if not self._frame_ready.wait(timeout=0.1):
+                continue
+
+            with self._lock:
+                frame = self._pending_frame
+                self._pending_frame = None
+                self._frame_ready.clear()
+
+            if frame is None:
+                continue
+
+            # Color conversion and downscaling happen here too, so the
+            # display thread's detect() call is just a slot write
+            rgb_frame = self._downscale_for_inference(self._convert_to_rgb(frame))
+            results = self.hands.process(rgb_frame)
+
+            with self._lock:
+                self.results = results
+
     def detect(self, frame):
         """
         Detect hands in the frame
-        
+
         Args:
             frame: OpenCV BGR image
-            
+
         Returns:
             bool: True if hand(s) detected, False otherwise
+            (in async mode this reflects the latest completed inference)
         """
-        # Convert BGR to RGB
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
-        # Process the frame
-        self.results = self.hands.process(rgb_frame)
-        
-        return self.results.multi_hand_landmarks is not None
+        # After a run of hand-free frames, drop to 1-in-3 inference -
+        # the user pausing is the common idle case, and the UI keeps
+        # refreshing at full rate regardless
+        self._frame_counter += 1
+        if (self._miss_streak >= self._idle_miss_threshold
+                and self._frame_counter % self._idle_skip_mod):
+            return False
+
+        # If nothing moved since the last frame, reuse the previous
+        # result instead of paying for TFLite inference
+        if self._motion_gate_skips(frame):
+            results = self.results
+            return results is not None and results.multi_hand_landmarks is not None
+
+        if self.use_async:
+            # Submit the raw BGR frame and read the last completed
+            # result; conversion, downscaling and inference all happen
+            # on the worker, and it overwrites any frame we haven't
+            # processed yet
+            with self._lock:
+                self._pending_frame = frame
+                self._frame_ready.set()
+                results = self.results
+        else:
+            # Convert BGR to RGB into a reused buffer and run at the
+            # reduced inference resolution when configured
+            rgb_frame = self._downscale_for_inference(self._convert_to_rgb(frame))
+            results = self.hands.process(rgb_frame)
+            self.results = results
+
+        detected = results is not None and results.multi_hand_landmarks is not None
+        self._miss_streak = 0 if detected else self._miss_streak + 1
+        return detected
+
+    def _motion_gate_skips(self, frame):
+        """
+        Decide whether this frame can skip inference
+
+        Compares a 32x32 grayscale thumbnail against the previous
+        frame's; returns True when the scene is static and we have not
+        already skipped the maximum number of consecutive frames.
+        """
+        if self.motion_threshold <= 0:
+            return False
+
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        cv2.resize(gray, (32, 32), dst=self._thumb, interpolation=cv2.INTER_AREA)
+
+        skip = False
+        if self._have_prev_thumb and self._skipped_frames < self._max_skip_frames:
+            diff = cv2.norm(self._thumb, self._prev_thumb, cv2.NORM_L1)
+            skip = diff < self.motion_threshold
+
+        # Swap thumbnails so next frame compares against this one
+        self._thumb, self._prev_thumb = self._prev_thumb, self._thumb
+        self._have_prev_thumb = True
+        self._skipped_frames = self._skipped_frames + 1 if skip else 0
+
+        return skip
+
+    def _convert_to_rgb(self, frame):
+        """
+        BGR to RGB conversion into a preallocated buffer
+
+        The buffer is marked read-only before being handed to MediaPipe,
+        which lets it skip its internal defensive copy.
+        """
+        buf = self._rgb_buffers[self._rgb_index]
+
+        if buf is None or buf.shape != frame.shape:
+            buf = np.empty(frame.shape, dtype=np.uint8)
+            self._rgb_buffers[self._rgb_index] = buf
+
+        buf.flags.writeable = True
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=buf)
+        buf.flags.writeable = False
+
+        # Alternate buffers so the inference thread can still read the
+        # one it was handed last frame
+        self._rgb_index ^= 1
+        return buf
+
+    def _downscale_for_inference(self, rgb_frame):
+        """Resize the RGB frame to the inference resolution if configured"""
+        iw, ih = self.inference_width, self.inference_height
+
+        if iw is None or ih is None:
+            return rgb_frame
+
+        if rgb_frame.shape[1] <= iw and rgb_frame.shape[0] <= ih:
+            return rgb_frame
+
+        buf = self._small_buffers[self._small_index]
+
+        if buf is None or buf.shape[:2] != (ih, iw):
+            buf = np.empty((ih, iw, 3), dtype=np.uint8)
+            self._small_buffers[self._small_index] = buf
+
+        buf.flags.writeable = True
+        cv2.resize(rgb_frame, (iw, ih), dst=buf, interpolation=cv2.INTER_LINEAR)
+        buf.flags.writeable = False
+
+        self._small_index ^= 1
+        return buf
         
     def get_hand_landmarks(self):
         """
@@ -77,18 +310,39 @@ class HandDetector:
         Returns:
             tuple: (x, y) coordinates or None
         """
-        hand_landmarks = self.get_hand_landmarks()
-        
-        if hand_landmarks:
-            return self.landmark_utils.get_landmark_position(
-                hand_landmarks, 
-                landmark_id, 
-                frame_width, 
-                frame_height
-            )
+        landmarks = self.get_landmark_array()
+
+        if landmarks is not None:
+            return (int(landmarks[landmark_id, 0] * frame_width),
+                    int(landmarks[landmark_id, 1] * frame_height))
         return None
+
+    def get_landmark_array(self):
+        """
+        Get the current landmarks as a (21, 3) float32 array
+
+        The protobuf is walked at most once per inference result and
+        the array is cached, so repeated landmark queries are free.
+
+        Returns:
+            np.ndarray of normalized (x, y, z) rows, or None
+        """
+        hand_landmarks = self.get_hand_landmarks()
+
+        if hand_landmarks is None:
+            return None
+
+        if hand_landmarks is not self._landmark_array_src:
+            self._landmark_array = self.landmark_utils.to_array(hand_landmarks)
+            self._landmark_array_src = hand_landmarks
+
+        return self._landmark_array
         
     def close(self):
         """Release MediaPipe resources"""
+        if self.use_async and self._running:
+            self._running = False
+            self._worker.join(timeout=1.0)
         if self.hands:
-            self.hands.close()
\ No newline at end of file
+            _release_hands(self._hands_key)
+            self.hands = None
\ No newline at end of file
@@ -1,4 +1,5 @@
 import cv2
+import numpy as np
 import mediapipe as mp
 
 class LandmarkUtils:
@@ -8,7 +9,17 @@ class LandmarkUtils:
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
         self.mp_hands = mp.solutions.hands
-        
+
+        # The default style getters build a fresh dict of DrawingSpec
+        # objects on every call - cache them once
+        self._landmark_style = self.mp_drawing_styles.get_default_hand_landmarks_style()
+        self._connection_style = self.mp_drawing_styles.get_default_hand_connections_style()
+        self._connections = self.mp_hands.HAND_CONNECTIONS
+
+        # Reused target for to_array - one buffer per utils instance
+        self._array_buf = np.empty((21, 3), dtype=np.float32)
+
+
     def draw_landmarks(self, image, hand_landmarks):
         """
         Draw hand landmarks and connections on the image
@@ -20,11 +31,35 @@ class LandmarkUtils:
         self.mp_drawing.draw_landmarks(
             image,
             hand_landmarks,
-            self.mp_hands.HAND_CONNECTIONS,
-            self.mp_drawing_styles.get_default_hand_landmarks_style(),
-            self.mp_drawing_styles.get_default_hand_connections_style()
+            self._connections,
+            self._landmark_style,
+            self._connection_style
         )
         
+    def to_array(self, hand_landmarks):
+        """
+        Extract all 21 landmarks into a (21, 3) float32 array
+
+        One pass over the protobuf repeated field instead of three
+        attribute accesses per queried landmark. The returned buffer is
+        reused across calls, so copy it if you need to keep it.
+
+        Args:
+            hand_landmarks: MediaPipe hand landmarks
+
+        Returns:
+            np.ndarray of normalized (x, y, z) rows, or None
+        """
+        if hand_landmarks is None:
+            return None
+
+        buf = self._array_buf
+        for i, lm in enumerate(hand_landmarks.landmark):
+            buf[i, 0] = lm.x
+            buf[i, 1] = lm.y
+            buf[i, 2] = lm.z
+        return buf
+
     def get_landmark_position(self, hand_landmarks, landmark_id, frame_width, frame_height):
         """
         Get pixel coordinates of a specific landmark
@@ -59,4 +94,27 @@ class LandmarkUtils:
         """
         if position is not None:
             cv2.circle(image, position, radius, color, -1)
-            cv2.circle(image, position, radius + 5, color, 2)
\ No newline at end of file
+            cv2.circle(image, position, radius + 5, color, 2)
+
+    def draw_fingertip_indicators(self, image, positions, color=(0, 255, 255), radius=10):
+        """
+        Draw circle indicators for several fingertips in one call
+
+        Args:
+            image: OpenCV image
+            positions: Iterable of (x, y) coordinates (None entries skipped)
+            color: BGR color tuple
+            radius: Circle radius
+        """
+        valid = [p for p in positions if p is not None]
+        if not valid:
+            return
+
+        # Local binding avoids repeated attribute lookups in the loops
+        _circle = cv2.circle
+        outer = radius + 5
+
+        for position in valid:
+            _circle(image, position, radius, color, -1)
+        for position in valid:
+            _circle(image, position, outer, color, 2)
\ No newline at end of file
@@ -1,6 +1,10 @@
 import cv2
 import time
 import sys
+import numpy as np
+import queue
+import logging
+import logging.handlers
 from src.camera.camera_stream import CameraStream
 from src.hand_tracking.hand_detector import HandDetector
 from src.hand_tracking.landmark_utils import LandmarkUtils
@@ -9,6 +13,37 @@ from src.strokes.stroke_tracker import StrokeTracker
 from src.ui.display import DisplayUI
 from src.utils.config import *
 
+# Loop logging goes through a queue drained by a background thread, so
+# a slow terminal can never stall the render loop on stdout
+logger = logging.getLogger(__name__)
+
+# Keyboard codes, resolved once instead of calling ord() per frame
+KEY_Q = ord('q')
+KEY_ESC = 27
+KEY_C = ord('c')
+KEY_H = ord('h')
+KEY_S = ord('s')
+KEY_R = ord('r')
+KEY_1 = ord('1')
+KEY_2 = ord('2')
+KEY_3 = ord('3')
+KEY_4 = ord('4')
+KEY_5 = ord('5')
+
+
+def _setup_logging():
+    """Configure non-blocking logging; returns the running listener"""
+    log_queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    listener.start()
+    return listener
+
+
 class AirWritingApp:
     """Main application for Air Writing - Phase 2: Gesture Logic & Writing Control"""
     
@@ -20,11 +55,13 @@ class AirWritingApp:
         print("="*60)
         
         # Initialize components
-        self.camera = CameraStream(CAMERA_INDEX, FRAME_WIDTH, FRAME_HEIGHT)
+        self.camera = CameraStream(CAMERA_INDEX, FRAME_WIDTH, FRAME_HEIGHT, FPS_TARGET)
         self.hand_detector = HandDetector(
             min_detection_confidence=MIN_DETECTION_CONFIDENCE,
             min_tracking_confidence=MIN_TRACKING_CONFIDENCE,
-            max_num_hands=MAX_NUM_HANDS
+            max_num_hands=MAX_NUM_HANDS,
+            inference_width=INFERENCE_WIDTH,
+            inference_height=INFERENCE_HEIGHT
         )
         self.landmark_utils = LandmarkUtils()
         
@@ -36,18 +73,68 @@ class AirWritingApp:
             smoothing_method='savitzky_golay'
         )
         self.display_ui = DisplayUI()
-        
+
+        # Gesture -> action dispatch, bound once instead of walking an
+        # if/elif chain on every confirmed gesture change
+        self._gesture_actions = {
+            GestureRecognizer.GESTURE_WRITING: self._start_writing,
+            GestureRecognizer.GESTURE_STOP: self._stop_writing,
+            GestureRecognizer.GESTURE_SPACE: self._add_space,
+            GestureRecognizer.GESTURE_CLEAR: self._clear_canvas,
+        }
+
+        # Keyboard dispatch table - one hash lookup per key press
+        # instead of a linear elif ladder (quit keys are handled
+        # inline in the loop since they have to break out of it)
+        self._keymap = {
+            KEY_C: self._on_clear_key,
+            KEY_H: self._on_toggle_guide,
+            KEY_S: self._on_toggle_smoothing,
+            KEY_R: self._on_toggle_raw,
+            KEY_1: lambda: self._on_set_method('moving_average', 'Moving Average'),
+            KEY_2: lambda: self._on_set_method('gaussian', 'Gaussian'),
+            KEY_3: lambda: self._on_set_method('savitzky_golay', 'Savitzky-Golay'),
+            KEY_4: lambda: self._on_set_method('spline', 'B-Spline'),
+            KEY_5: lambda: self._on_set_method('kalman', 'Kalman Filter'),
+        }
+
         # State management
         self.is_writing = False
         self.show_gesture_feedback = False
-        self.feedback_start_time = 0
+        self.feedback_deadline_ns = 0
         self.feedback_gesture = None
         self.space_count = 0
         self.show_raw_stroke = False  # Toggle to show raw vs smoothed
+        self.last_processed_id = -1  # Skip re-processing duplicate frames
+        # Capture resolution is fixed by config, so landmark-to-pixel
+        # scaling never needs to re-read frame.shape per frame
+        self.frame_width = FRAME_WIDTH
+        self.frame_height = FRAME_HEIGHT
+        self.gesture_reset_done = False  # Avoid re-resetting the recognizer every idle frame
         
-        # FPS calculation
-        self.prev_time = 0
-        self.fps = 0
+        # Non-blocking log output for the render loop
+        self._log_listener = _setup_logging()
+
+        # FPS calculation (EMA over OpenCV tick counter)
+        self.prev_tick = 0
+        self.fps = 0.0
+
+        # Display throttling: process every frame, but refresh the
+        # window at most this often (imshow + the HighGUI event pump
+        # cost a few ms per call on some backends)
+        self.display_interval = 1.0 / 30.0
+        self._last_show = 0.0
+
+        # Per-stage latency ring buffer in milliseconds; summarized as
+        # p50/p95/p99 at cleanup so optimizations stay measurable
+        self._stage_names = ('capture', 'inference', 'draw', 'display')
+        self._stage_times = np.zeros((1024, 4), dtype=np.float32)
+        self._stage_index = 0
+
+        # cv2.waitKey sleeps ~1 ms to pump GUI events; cv2.pollKey
+        # (OpenCV >= 4.5) pumps without sleeping, so the loop only pays
+        # the sleep on every third frame
+        self._has_pollkey = hasattr(cv2, 'pollKey')
         
         print(f"\nConfiguration:")
         print(f"  - Camera Resolution: {FRAME_WIDTH}x{FRAME_HEIGHT}")
@@ -75,15 +162,18 @@ class AirWritingApp:
         self.show_guide = True
         
     def calculate_fps(self):
-        """Calculate current FPS"""
-        current_time = time.time()
-        self.fps = 1 / (current_time - self.prev_time)
-        self.prev_time = current_time
+        """Update the FPS estimate (exponential moving average)"""
+        tick = cv2.getTickCount()
+        dt = (tick - self.prev_tick) / cv2.getTickFrequency()
+        self.fps = 0.9 * self.fps + 0.1 / (dt + 1e-9)
+        self.prev_tick = tick
         
     def trigger_feedback(self, gesture):
         """Trigger visual feedback for a gesture"""
         self.show_gesture_feedback = True
-        self.feedback_start_time = time.time()
+        # Monotonic integer nanosecond deadline - immune to wall-clock
+        # (NTP) jumps, and the per-frame check is a single compare
+        self.feedback_deadline_ns = time.perf_counter_ns() + 1_000_000_000
         self.feedback_gesture = gesture
         
     def handle_gesture_actions(self, gesture, gesture_changed, finger_tip_pos):
@@ -98,38 +188,70 @@ class AirWritingApp:
         # Only act on gesture changes
         if not gesture_changed:
             return
-            
-        if gesture == GestureRecognizer.GESTURE_WRITING:
-            # Start writing
-            if not self.is_writing and finger_tip_pos:
-                self.is_writing = True
-                self.stroke_tracker.start_stroke(finger_tip_pos)
-                self.trigger_feedback('writing')
-                print("[GESTURE] Writing started")
-                
-        elif gesture == GestureRecognizer.GESTURE_STOP:
-            # Stop writing
-            if self.is_writing:
-                self.is_writing = False
-                completed_stroke = self.stroke_tracker.end_stroke()
-                if completed_stroke:
-                    print(f"[GESTURE] Stroke completed: {len(completed_stroke)} points")
-                self.trigger_feedback('stop')
-                print("[GESTURE] Writing stopped")
-                
-        elif gesture == GestureRecognizer.GESTURE_SPACE:
-            # Add space (we'll implement this more in later phases)
-            self.space_count += 1
-            self.trigger_feedback('space')
-            print(f"[GESTURE] Space added (total: {self.space_count})")
-            
-        elif gesture == GestureRecognizer.GESTURE_CLEAR:
-            # Clear canvas
-            self.stroke_tracker.clear_all_strokes()
+
+        action = self._gesture_actions.get(gesture)
+        if action:
+            action(finger_tip_pos)
+
+    def _start_writing(self, finger_tip_pos):
+        """Begin a new stroke at the fingertip"""
+        if not self.is_writing and finger_tip_pos:
+            self.is_writing = True
+            self.stroke_tracker.start_stroke(finger_tip_pos)
+            self.trigger_feedback('writing')
+            logger.info("[GESTURE] Writing started")
+
+    def _stop_writing(self, finger_tip_pos):
+        """Finish and save the current stroke"""
+        if self.is_writing:
             self.is_writing = False
-            self.space_count = 0
-            self.trigger_feedback('clear')
-            print("[GESTURE] Canvas cleared")
+            completed_stroke = self.stroke_tracker.end_stroke()
+            if completed_stroke is not None:
+                logger.info(f"[GESTURE] Stroke completed: {len(completed_stroke)} points")
+            self.trigger_feedback('stop')
+            logger.info("[GESTURE] Writing stopped")
+
+    def _add_space(self, finger_tip_pos):
+        """Add a space (we'll implement this more in later phases)"""
+        self.space_count += 1
+        self.trigger_feedback('space')
+        logger.info(f"[GESTURE] Space added (total: {self.space_count})")
+
+    def _clear_canvas(self, finger_tip_pos):
+        """Clear all strokes and reset writing state"""
+        self.stroke_tracker.clear_all_strokes()
+        self.display_ui.reset_cache()
+        self.is_writing = False
+        self.space_count = 0
+        self.trigger_feedback('clear')
+        logger.info("[GESTURE] Canvas cleared")
+
+    def _on_clear_key(self):
+        """Keyboard: clear the canvas"""
+        self.stroke_tracker.clear_all_strokes()
+        self.display_ui.reset_cache()
+        self.space_count = 0
+        logger.info("[INFO] Canvas cleared (keyboard)")
+
+    def _on_toggle_guide(self):
+        """Keyboard: toggle the gesture guide overlay"""
+        self.show_guide = not self.show_guide
+        logger.info(f"[INFO] Gesture guide: {'ON' if self.show_guide else 'OFF'}")
+
+    def _on_toggle_smoothing(self):
+        """Keyboard: toggle stroke smoothing"""
+        enabled = self.stroke_tracker.toggle_smoothing()
+        logger.info(f"[INFO] Smoothing: {'ENABLED' if enabled else 'DISABLED'}")
+
+    def _on_toggle_raw(self):
+        """Keyboard: toggle the raw stroke overlay"""
+        self.show_raw_stroke = not self.show_raw_stroke
+        logger.info(f"[INFO] Raw stroke overlay: {'ON' if self.show_raw_stroke else 'OFF'}")
+
+    def _on_set_method(self, method, label):
+        """Keyboard: switch the smoothing method"""
+        self.stroke_tracker.set_smoothing_method(method)
+        logger.info(f"[INFO] Smoothing method: {label}")
             
     def draw_ui(self, frame, hand_detected, finger_tip_pos, gesture_info):
         """
@@ -139,7 +261,7 @@ class AirWritingApp:
             frame: OpenCV image
             hand_detected: Boolean indicating if hand is detected
             finger_tip_pos: (x, y) position of index finger tip or None
-            gesture_info: Gesture information dictionary
+            gesture_info: GestureInfo snapshot from the recognizer
         """
         # Draw FPS
         if SHOW_FPS:
@@ -174,31 +296,36 @@ class AirWritingApp:
             smoothing_method=self.stroke_tracker.smoothing_method
         )
         
-        # Draw gesture guide
-        if self.show_guide:
-            height = frame.shape[0]
-            self.display_ui.draw_gesture_guide(frame, position=(10, height - 200))
-        
-        # Draw gesture feedback
+        # Blit the pre-rendered static UI (gesture guide + shortcuts)
+        self.display_ui.draw_static_overlay(frame, show_guide=self.show_guide)
+
+
+        # Draw gesture feedback, fading the banner out over its last
+        # 300 ms instead of vanishing abruptly
         if self.show_gesture_feedback:
-            if time.time() - self.feedback_start_time < 1.0:
-                self.display_ui.show_gesture_feedback(frame, self.feedback_gesture)
+            remaining_ns = self.feedback_deadline_ns - time.perf_counter_ns()
+            if remaining_ns > 0:
+                alpha = min(1.0, remaining_ns / 300_000_000)
+                self.display_ui.show_gesture_feedback(
+                    frame, self.feedback_gesture, alpha
+                )
             else:
                 self.show_gesture_feedback = False
         
-        # Draw instructions
-        height, width = frame.shape[:2]
-        instructions = "h:help | c:clear | s:smooth | r:raw | 1-5:method | q:quit"
-        cv2.putText(frame, instructions, (10, height - 20), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
-        
     def run(self):
         """Main application loop"""
         # Start camera
         self.camera.start()
-        
+
+        # Drivers may not honor the requested resolution exactly, so
+        # sync the cached frame size with an actual frame once instead
+        # of re-reading frame.shape every iteration
+        success, frame = self.camera.read_frame()
+        if success:
+            self.frame_height, self.frame_width = frame.shape[:2]
+
         # Initialize time for FPS calculation
-        self.prev_time = time.time()
+        self.prev_tick = cv2.getTickCount()
         
         print("\n[INFO] Application started! Show your hand to the camera.")
         print("[INFO] Make gestures to control air writing...\n")
@@ -206,28 +333,58 @@ class AirWritingApp:
         try:
             while True:
                 # Read frame from camera
+                t0 = time.perf_counter_ns()
                 success, frame = self.camera.read_frame()
-                
+
                 if not success:
-                    print("[ERROR] Failed to read frame from camera")
+                    logger.info("[ERROR] Failed to read frame from camera")
                     break
-                
-                height, width = frame.shape[:2]
-                
+
+                # The camera thread publishes latest-frame-only; if no
+                # newer frame arrived there is nothing new to infer on
+                # - keep the UI responsive and retry. Compare capture
+                # ids, not object identity: the capture-side buffer
+                # pool recycles ndarrays, so the same object can carry
+                # a different frame
+                frame_id = self.camera.last_frame_id
+                if frame_id == self.last_processed_id:
+                    key = cv2.waitKeyEx(1)
+                    if key == KEY_Q or key == KEY_ESC:
+                        print("\n[INFO] Exiting application...")
+                        break
+                    elif key != -1:
+                        # This call consumed the key event, so it must
+                        # dispatch it too - dropping non-quit keys here
+                        # made the controls go dead whenever the loop
+                        # outpaced the camera
+                        handler = self._keymap.get(key)
+                        if handler:
+                            handler()
+                    continue
+                self.last_processed_id = frame_id
+
+                width, height = self.frame_width, self.frame_height
+
                 # Detect hands
+                t1 = time.perf_counter_ns()
                 hand_detected = self.hand_detector.detect(frame)
-                
+                t2 = time.perf_counter_ns()
+
                 # Get index finger tip position
                 finger_tip_pos = None
                 gesture_info = self.gesture_recognizer.get_gesture_info()
                 
                 if hand_detected:
-                    # Get hand landmarks
-                    hand_landmarks = self.hand_detector.get_hand_landmarks()
-                    
+                    self.gesture_reset_done = False
+
+                    # Get hand landmarks as the cached (21, 3) array -
+                    # the recognizer consumes it without another
+                    # protobuf pass
+                    hand_landmarks = self.hand_detector.get_landmark_array()
+
                     # Get index finger tip position
                     finger_tip_pos = self.hand_detector.get_index_finger_tip(width, height)
-                    
+
                     # Update gesture recognition
                     gesture, gesture_changed = self.gesture_recognizer.update_gesture(
                         hand_landmarks, width, height
@@ -250,52 +407,51 @@ class AirWritingApp:
                         self.is_writing = False
                         self.stroke_tracker.end_stroke()
                     
-                    # Reset gesture recognizer
-                    self.gesture_recognizer.reset()
+                    # Reset gesture recognizer (only once per hand loss)
+                    if not self.gesture_reset_done:
+                        self.gesture_recognizer.reset()
+                        self.gesture_reset_done = True
                 
                 # Calculate FPS
                 self.calculate_fps()
                 
                 # Draw all UI elements
+                t3 = time.perf_counter_ns()
                 self.draw_ui(frame, hand_detected, finger_tip_pos, gesture_info)
-                
-                # Display the frame
-                cv2.imshow(WINDOW_NAME, frame)
-                
-                # Handle key presses
-                key = cv2.waitKey(1) & 0xFF
-                if key == ord('q') or key == 27:  # 'q' or ESC
+                t4 = time.perf_counter_ns()
+
+                # Display the frame (throttled to ~30 Hz - inference
+                # keeps running at full rate in between)
+                now = time.monotonic()
+                if now - self._last_show >= self.display_interval:
+                    cv2.imshow(WINDOW_NAME, frame)
+                    self._last_show = now
+
+                # Record per-stage latencies in the ring buffer
+                row = self._stage_times[self._stage_index & 1023]
+                row[0] = (t1 - t0) / 1e6
+                row[1] = (t2 - t1) / 1e6
+                row[2] = (t4 - t3) / 1e6
+                row[3] = (time.perf_counter_ns() - t4) / 1e6
+                self._stage_index += 1
+
+                # Handle key presses (raw keycodes, no masking needed).
+                # Two of three frames use the non-sleeping pollKey;
+                # waitKeyEx's ~1 ms sleep runs on the third, keeping key
+                # handling at >= 20 Hz
+                if self._has_pollkey and self._stage_index % 3:
+                    key = cv2.pollKey()
+                else:
+                    key = cv2.waitKeyEx(1)
+                if key == KEY_Q or key == KEY_ESC:
                     print("\n[INFO] Exiting application...")
                     break
-                elif key == ord('c'):  # Clear canvas
-                    self.stroke_tracker.clear_all_strokes()
-                    self.space_count = 0
-                    print("[INFO] Canvas cleared (keyboard)")
-                elif key == ord('h'):  # Toggle help
-                    self.show_guide = not self.show_guide
-                    print(f"[INFO] Gesture guide: {'ON' if self.show_guide else 'OFF'}")
-                elif key == ord('s'):  # Toggle smoothing
-                    enabled = self.stroke_tracker.toggle_smoothing()
-                    print(f"[INFO] Smoothing: {'ENABLED' if enabled else 'DISABLED'}")
-                elif key == ord('r'):  # Toggle raw stroke overlay
-                    self.show_raw_stroke = not self.show_raw_stroke
-                    print(f"[INFO] Raw stroke overlay: {'ON' if self.show_raw_stroke else 'OFF'}")
-                elif key == ord('1'):  # Moving average
-                    self.stroke_tracker.set_smoothing_method('moving_average')
-                    print("[INFO] Smoothing method: Moving Average")
-                elif key == ord('2'):  # Gaussian
-                    self.stroke_tracker.set_smoothing_method('gaussian')
-                    print("[INFO] Smoothing method: Gaussian")
-                elif key == ord('3'):  # Savitzky-Golay (default)
-                    self.stroke_tracker.set_smoothing_method('savitzky_golay')
-                    print("[INFO] Smoothing method: Savitzky-Golay")
-                elif key == ord('4'):  # Spline
-                    self.stroke_tracker.set_smoothing_method('spline')
-                    print("[INFO] Smoothing method: B-Spline")
-                elif key == ord('5'):  # Kalman
-                    self.stroke_tracker.set_smoothing_method('kalman')
-                    print("[INFO] Smoothing method: Kalman Filter")
-                    
+                elif key != -1:
+                    handler = self._keymap.get(key)
+                    if handler:
+                        handler()
+
+
         except KeyboardInterrupt:
             print("\n[INFO] Application interrupted by user")
             
@@ -318,10 +474,9 @@ class AirWritingApp:
         print(f"  Smoothing: {'ENABLED' if self.stroke_tracker.enable_smoothing else 'DISABLED'}")
         print(f"  Smoothing Method: {self.stroke_tracker.smoothing_method}")
         
-        # Calculate total points
-        all_strokes = self.stroke_tracker.get_all_strokes()
-        total_raw_points = sum(s.get('point_count', 0) for s in all_strokes)
-        total_smoothed_points = sum(s.get('smoothed_count', 0) for s in all_strokes)
+        # Calculate total points (single numpy sums over the per-stroke
+        # count arrays, no per-dict traversal)
+        total_raw_points, total_smoothed_points = self.stroke_tracker.get_point_totals()
         
         if total_raw_points > 0:
             reduction = ((total_raw_points - total_smoothed_points) / total_raw_points) * 100
@@ -329,9 +484,22 @@ class AirWritingApp:
             print(f"  Total Smoothed Points: {total_smoothed_points}")
             print(f"  Point Reduction: {reduction:.1f}%")
         
+        # Per-stage latency percentiles over the last ~1024 frames
+        filled = min(self._stage_index, len(self._stage_times))
+        if filled:
+            print("\n  Stage latencies (ms, last %d frames):" % filled)
+            for i, name in enumerate(self._stage_names):
+                p50, p95, p99 = np.percentile(
+                    self._stage_times[:filled, i], [50, 95, 99]
+                )
+                print(f"    {name:<10} p50={p50:6.2f}  p95={p95:6.2f}  p99={p99:6.2f}")
+
         print("="*60)
         print("[INFO] Cleanup completed")
 
+        # Flush any queued loop log records before exiting
+        self._log_listener.stop()
+
 def main():
     """Entry point"""
     app = AirWritingApp()
@@ -1,47 +1,229 @@
+import functools
 import numpy as np
-from scipy.interpolate import splprep, splev
-from scipy.signal import savgol_filter
+from scipy.ndimage import convolve1d, gaussian_filter1d
+from scipy.signal import savgol_coeffs
+
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    # Numba is optional - fall back to the pure-Python kernels
+    _HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True)
+def _kalman_axis(values, out, process_variance, measurement_variance):
+    """
+    Constant-velocity Kalman filter over one coordinate axis
+
+    The 4-state [x, y, vx, vy] filter decouples exactly into two
+    independent [position, velocity] filters because the transition,
+    measurement and noise matrices have no cross-axis terms, so each
+    step is a handful of scalar operations with a scalar innovation -
+    no matrix inverse at all.
+    """
+    p = values[0]
+    v = 0.0
+    p00 = 1000.0
+    p01 = 0.0
+    p11 = 1000.0
+
+    for i in range(values.shape[0]):
+        # Predict
+        p = p + v
+        a00 = p00 + 2.0 * p01 + p11 + process_variance
+        a01 = p01 + p11
+        a11 = p11 + process_variance
+
+        # Update
+        s = a00 + measurement_variance
+        k0 = a00 / s
+        k1 = a01 / s
+        innovation = values[i] - p
+        p += k0 * innovation
+        v += k1 * innovation
+        p00 = (1.0 - k0) * a00
+        p01 = (1.0 - k0) * a01
+        p11 = a11 - k1 * a01
+
+        out[i] = p
+
+
+@njit(cache=True, parallel=True)
+def _kalman_batch(xs, ys, lengths, out_x, out_y, process_variance, measurement_variance):
+    """
+    Kalman-filter many strokes at once, one stroke per parallel worker
+
+    Strokes are padded to a common length; each row filters
+    independently, so the outer loop parallelizes cleanly.
+    """
+    for s in prange(lengths.shape[0]):
+        n = lengths[s]
+        _kalman_axis(xs[s, :n], out_x[s, :n], process_variance, measurement_variance)
+        _kalman_axis(ys[s, :n], out_y[s, :n], process_variance, measurement_variance)
+
+
+@functools.lru_cache(maxsize=32)
+def _sg_kernel(window_length, polyorder):
+    """Savitzky-Golay FIR coefficients, computed once per (w, p)"""
+    return savgol_coeffs(window_length, polyorder)
+
+
+@functools.lru_cache(maxsize=8)
+def _fused_sg_gauss_kernel(window_length, polyorder, sigma):
+    """
+    Savitzky-Golay and Gaussian kernels fused into one FIR filter
+
+    Convolution is associative, so the two linear passes of the default
+    multi-pass pipeline collapse into a single kernel applied once.
+    """
+    radius = int(4.0 * sigma + 0.5)
+    x = np.arange(-radius, radius + 1)
+    gauss = np.exp(-0.5 * (x / sigma) ** 2)
+    gauss /= gauss.sum()
+    return np.convolve(savgol_coeffs(window_length, polyorder), gauss)
+
+
+@njit(cache=True)
+def _dedup_scan(x, y, min_dist_sq, keep):
+    """
+    Mark points far enough from the last kept point
+
+    The gate is stateful (distance is measured from the last KEPT
+    point, not the previous input point), so it stays a scan - but a
+    compiled one with squared distances, no per-point sqrt.
+    """
+    keep[0] = True
+    last_x = x[0]
+    last_y = y[0]
+
+    for i in range(1, x.shape[0]):
+        dx = x[i] - last_x
+        dy = y[i] - last_y
+        if dx * dx + dy * dy >= min_dist_sq:
+            keep[i] = True
+            last_x = x[i]
+            last_y = y[i]
+
+
+@njit(cache=True, fastmath=True)
+def _dp_farthest(x, y, s, e):
+    """
+    Index and squared distance of the point farthest from segment s-e
+
+    Tight scalar scan used by Douglas-Peucker when numba is available;
+    the line terms are hoisted so each point costs two multiplies.
+    """
+    dx = x[e] - x[s]
+    dy = y[e] - y[s]
+    c = x[e] * y[s] - y[e] * x[s]
+    seg_sq = dx * dx + dy * dy
+
+    best = -1.0
+    best_i = -1
+    for i in range(s + 1, e):
+        if seg_sq == 0.0:
+            ddx = x[i] - x[s]
+            ddy = y[i] - y[s]
+            d = ddx * ddx + ddy * ddy
+        else:
+            num = dy * x[i] - dx * y[i] + c
+            d = num * num / seg_sq
+        if d > best:
+            best = d
+            best_i = i
+
+    return best_i, best
+
 
 class StrokeSmoother:
     """Advanced stroke smoothing and noise reduction algorithms"""
-    
+
+    # Recognized method names for smooth_stroke / set_smoothing_method
+    SMOOTHING_METHODS = ('moving_average', 'gaussian', 'savitzky_golay',
+                         'spline', 'kalman')
+
     def __init__(self):
         """Initialize stroke smoother"""
-        self.smoothing_methods = {
-            'moving_average': self.moving_average_smooth,
-            'gaussian': self.gaussian_smooth,
-            'savitzky_golay': self.savitzky_golay_smooth,
-            'spline': self.spline_smooth,
-            'kalman': self.kalman_smooth
+        # Reusable output scratch for the per-frame FIR smoothers: a
+        # float workspace and an int32 result, grown geometrically.
+        # Their returned arrays are views into this scratch, valid
+        # until the next smoothing call - long-lived results (e.g.
+        # completed strokes) must be copied by the caller.
+        self._scratch_f = np.empty((1024, 2), dtype=np.float32)
+        self._scratch_i = np.empty((1024, 2), dtype=np.int32)
+
+        # Warm up the compiled kernels so JIT compilation is not paid
+        # on the first stroke
+        _kalman_axis(np.zeros(2), np.empty(2), 1e-5, 1e-1)
+        _dedup_scan(np.zeros(2), np.zeros(2), 1.0, np.zeros(2, dtype=np.bool_))
+        if _HAVE_NUMBA:
+            _dp_farthest(np.zeros(3), np.zeros(3), 0, 2)
+
+        # Method dispatch, bound once at construction: smooth_stroke
+        # resolves the method with a single dict lookup instead of a
+        # string-compare chain, and each adapter forwards only the
+        # keyword arguments its filter understands, so callers can pass
+        # a superset (the tracker sends SG window parameters whatever
+        # the active method is)
+        self._method_dispatch = {
+            'savitzky_golay': lambda pts, kw: self.savitzky_golay_smooth(
+                pts, kw.get('window_length', 11), kw.get('polyorder', 3)),
+            'gaussian': lambda pts, kw: self.gaussian_smooth(
+                pts, kw.get('sigma', 2.0)),
+            'kalman': lambda pts, kw: self.kalman_smooth(
+                pts, kw.get('process_variance', 1e-5),
+                kw.get('measurement_variance', 1e-1)),
+            'moving_average': lambda pts, kw: self.moving_average_smooth(
+                pts, kw.get('window_size', 5)),
+            'spline': lambda pts, kw: self.spline_smooth(
+                pts, kw.get('smoothing_factor', 0.0), kw.get('num_points')),
         }
-        
-        # Kalman filter state
-        self.kalman_state = None
-        self.kalman_covariance = None
+
+    def _out_views(self, n):
+        """Float and int32 scratch views of length n (reused, growing)"""
+        if n > len(self._scratch_f):
+            capacity = max(n, 2 * len(self._scratch_f))
+            self._scratch_f = np.empty((capacity, 2), dtype=np.float32)
+            self._scratch_i = np.empty((capacity, 2), dtype=np.int32)
+        return self._scratch_f[:n], self._scratch_i[:n]
         
     def moving_average_smooth(self, points, window_size=5):
         """
         Simple moving average smoothing
-        
+
         Args:
             points: List of (x, y) tuples
             window_size: Size of the moving window
-            
+
         Returns:
-            List of smoothed (x, y) points
+            (n, 2) int32 array of smoothed points
         """
         if len(points) < window_size:
             return points
-            
-        points_array = np.array(points)
-        smoothed = np.zeros_like(points_array)
-        
-        for i in range(len(points)):
-            start_idx = max(0, i - window_size // 2)
-            end_idx = min(len(points), i + window_size // 2 + 1)
-            smoothed[i] = np.mean(points_array[start_idx:end_idx], axis=0)
-            
-        return [tuple(p) for p in smoothed.astype(int)]
+
+        # Windowed means via cumulative sums - one vectorized pass
+        # instead of a Python loop of per-point slices. The window
+        # shrinks at the stroke ends, matching centered-mean behavior.
+        points_array = np.asarray(points, dtype=np.float32)
+        n = len(points_array)
+        half = window_size // 2
+
+        csum = np.vstack((np.zeros((1, 2), dtype=np.float32),
+                          np.cumsum(points_array, axis=0)))
+        idx = np.arange(n)
+        start = np.maximum(idx - half, 0)
+        end = np.minimum(idx + half + 1, n)
+
+        _, ibuf = self._out_views(n)
+        ibuf[:] = (csum[end] - csum[start]) / (end - start)[:, None]
+        return ibuf
         
     def gaussian_smooth(self, points, sigma=2.0):
         """
@@ -52,28 +234,21 @@ class StrokeSmoother:
             sigma: Standard deviation for Gaussian kernel
             
         Returns:
-            List of smoothed (x, y) points
+            (n, 2) int32 array of smoothed points
         """
         if len(points) < 3:
             return points
-            
-        points_array = np.array(points, dtype=float)
-        window_size = int(6 * sigma)
-        
-        if window_size % 2 == 0:
-            window_size += 1
-            
-        # Create Gaussian kernel
-        x = np.arange(window_size) - window_size // 2
-        kernel = np.exp(-0.5 * (x / sigma) ** 2)
-        kernel = kernel / kernel.sum()
-        
-        # Apply convolution
-        smoothed = np.zeros_like(points_array)
-        for dim in range(2):
-            smoothed[:, dim] = np.convolve(points_array[:, dim], kernel, mode='same')
-            
-        return [tuple(p) for p in smoothed.astype(int)]
+
+        # scipy's separable 1D Gaussian - no per-call kernel build, and
+        # nearest-edge handling avoids the zero-padding droop that
+        # np.convolve(mode='same') gave the stroke ends
+        points_array = np.asarray(points, dtype=np.float32)
+        fbuf, ibuf = self._out_views(len(points_array))
+        gaussian_filter1d(points_array[:, 0], sigma, mode='nearest', output=fbuf[:, 0])
+        gaussian_filter1d(points_array[:, 1], sigma, mode='nearest', output=fbuf[:, 1])
+        ibuf[:] = fbuf
+
+        return ibuf
         
     def savitzky_golay_smooth(self, points, window_length=11, polyorder=3):
         """
@@ -85,66 +260,84 @@ class StrokeSmoother:
             polyorder: Order of the polynomial
             
         Returns:
-            List of smoothed (x, y) points
+            (n, 2) int32 array of smoothed points
         """
         if len(points) < window_length:
             return points
-            
+
         # Ensure window_length is odd
         if window_length % 2 == 0:
             window_length += 1
-            
+
         # Ensure window_length > polyorder
         window_length = max(window_length, polyorder + 2)
-        
+
         if len(points) < window_length:
             return self.moving_average_smooth(points, window_size=len(points) // 2)
-            
-        points_array = np.array(points, dtype=float)
-        
+
+        points_array = np.asarray(points, dtype=np.float32)
+
         try:
-            smoothed = np.zeros_like(points_array)
-            smoothed[:, 0] = savgol_filter(points_array[:, 0], window_length, polyorder)
-            smoothed[:, 1] = savgol_filter(points_array[:, 1], window_length, polyorder)
-            return [tuple(p) for p in smoothed.astype(int)]
+            # Fixed (window, order) SG filtering is just FIR convolution
+            # with precomputed coefficients - no Vandermonde/lstsq per
+            # call. Edges use nearest-replication instead of
+            # savgol_filter's polynomial extrapolation.
+            kernel = _sg_kernel(window_length, polyorder)
+            fbuf, ibuf = self._out_views(len(points_array))
+            convolve1d(points_array[:, 0], kernel, mode='nearest', output=fbuf[:, 0])
+            convolve1d(points_array[:, 1], kernel, mode='nearest', output=fbuf[:, 1])
+            ibuf[:] = fbuf
+            return ibuf
         except Exception as e:
             # Fallback to moving average if Savitzky-Golay fails
             return self.moving_average_smooth(points)
             
     def spline_smooth(self, points, smoothing_factor=0.0, num_points=None):
         """
-        B-spline interpolation for smooth curves
-        
+        Catmull-Rom spline interpolation for smooth curves
+
+        A local C1 spline: each output sample depends on only four
+        neighboring control points, so there is no global linear solve
+        the way splprep needs - per-call cost stays linear even when
+        invoked repeatedly on a growing stroke.
+
         Args:
             points: List of (x, y) tuples
-            smoothing_factor: Smoothing parameter (0 = interpolate exactly)
+            smoothing_factor: Unused (kept for call compatibility)
             num_points: Number of points in output (None = same as input)
-            
+
         Returns:
-            List of smoothed (x, y) points
+            (n, 2) int32 array of smoothed points
         """
         if len(points) < 4:
             return points
-            
-        points_array = np.array(points, dtype=float)
-        
-        try:
-            # Parametric spline interpolation
-            tck, u = splprep([points_array[:, 0], points_array[:, 1]], 
-                            s=smoothing_factor, k=min(3, len(points) - 1))
-            
-            # Generate smooth curve
-            if num_points is None:
-                num_points = len(points)
-                
-            u_new = np.linspace(0, 1, num_points)
-            x_new, y_new = splev(u_new, tck)
-            
-            smoothed = np.column_stack([x_new, y_new])
-            return [tuple(p) for p in smoothed.astype(int)]
-        except Exception as e:
-            # Fallback to Gaussian smoothing if spline fails
-            return self.gaussian_smooth(points)
+
+        points_array = np.asarray(points, dtype=np.float32)
+        n = len(points_array)
+
+        if num_points is None:
+            num_points = n
+
+        # Duplicate the endpoints so every interior segment has its
+        # two neighbors
+        ext = np.vstack((points_array[0], points_array, points_array[-1]))
+        p0, p1 = ext[:-3], ext[1:-2]
+        p2, p3 = ext[2:-1], ext[3:]
+
+        # Catmull-Rom basis, broadcast over all segments at once:
+        # P(t) = 0.5*(2*P1 + (P2-P0)t + (2P0-5P1+4P2-P3)t^2
+        #             + (-P0+3P1-3P2+P3)t^3)
+        samples = max(1, num_points // (n - 1))
+        t = np.linspace(0.0, 1.0, samples, endpoint=False)[None, :, None]
+
+        a = 2.0 * p1[:, None, :]
+        b = (p2 - p0)[:, None, :]
+        c = (2.0 * p0 - 5.0 * p1 + 4.0 * p2 - p3)[:, None, :]
+        d = (-p0 + 3.0 * p1 - 3.0 * p2 + p3)[:, None, :]
+        curve = 0.5 * (a + b * t + c * t * t + d * t ** 3)
+
+        smoothed = np.vstack((curve.reshape(-1, 2), points_array[-1]))
+        return smoothed.astype(np.int32)
             
     def kalman_smooth(self, points, process_variance=1e-5, measurement_variance=1e-1):
         """
@@ -156,48 +349,61 @@ class StrokeSmoother:
             measurement_variance: Measurement noise variance
             
         Returns:
-            List of smoothed (x, y) points
+            (n, 2) int32 array of smoothed points
         """
         if len(points) < 2:
             return points
-            
-        smoothed = []
-        
-        # Initialize Kalman filter
-        state = np.array([points[0][0], points[0][1], 0, 0], dtype=float)  # [x, y, vx, vy]
-        covariance = np.eye(4) * 1000
-        
-        # State transition matrix (constant velocity model)
-        F = np.array([[1, 0, 1, 0],
-                     [0, 1, 0, 1],
-                     [0, 0, 1, 0],
-                     [0, 0, 0, 1]], dtype=float)
-        
-        # Measurement matrix
-        H = np.array([[1, 0, 0, 0],
-                     [0, 1, 0, 0]], dtype=float)
-        
-        # Process and measurement noise
-        Q = np.eye(4) * process_variance
-        R = np.eye(2) * measurement_variance
-        
-        for point in points:
-            # Prediction
-            state = F @ state
-            covariance = F @ covariance @ F.T + Q
-            
-            # Update
-            measurement = np.array(point, dtype=float)
-            y = measurement - H @ state
-            S = H @ covariance @ H.T + R
-            K = covariance @ H.T @ np.linalg.inv(S)
-            
-            state = state + K @ y
-            covariance = (np.eye(4) - K @ H) @ covariance
-            
-            smoothed.append((int(state[0]), int(state[1])))
-            
-        return smoothed
+
+        # Run the compiled per-axis kernel; the constant-velocity model
+        # has no cross-axis coupling, so x and y filter independently
+        points_array = np.asarray(points, dtype=np.float32)
+        smoothed = np.empty_like(points_array)
+
+        _kalman_axis(np.ascontiguousarray(points_array[:, 0]),
+                     smoothed[:, 0], process_variance, measurement_variance)
+        _kalman_axis(np.ascontiguousarray(points_array[:, 1]),
+                     smoothed[:, 1], process_variance, measurement_variance)
+
+        return smoothed.astype(np.int32)
+
+    def batch_kalman_smooth(self, strokes, process_variance=1e-5, measurement_variance=1e-1):
+        """
+        Kalman-smooth many strokes in one padded, parallel pass
+
+        Useful for replay/export workloads: strokes are stacked into
+        padded row-major arrays and filtered one stroke per parallel
+        worker instead of one Python-level call each.
+
+        Args:
+            strokes: List of point sequences (each a list of (x, y) or array)
+            process_variance: Process noise variance
+            measurement_variance: Measurement noise variance
+
+        Returns:
+            List of (n, 2) int32 arrays, one per input stroke
+        """
+        if not strokes:
+            return []
+
+        lengths = np.array([len(s) for s in strokes], dtype=np.int64)
+        max_len = int(lengths.max())
+
+        xs = np.zeros((len(strokes), max_len), dtype=np.float32)
+        ys = np.zeros((len(strokes), max_len), dtype=np.float32)
+        for i, stroke in enumerate(strokes):
+            pts = np.asarray(stroke, dtype=np.float32)
+            xs[i, :len(pts)] = pts[:, 0]
+            ys[i, :len(pts)] = pts[:, 1]
+
+        out_x = np.empty_like(xs)
+        out_y = np.empty_like(ys)
+        _kalman_batch(xs, ys, lengths, out_x, out_y,
+                      process_variance, measurement_variance)
+
+        return [
+            np.column_stack((out_x[i, :n], out_y[i, :n])).astype(np.int32)
+            for i, n in enumerate(lengths)
+        ]
         
     def remove_duplicates(self, points, min_distance=2):
         """
@@ -208,21 +414,18 @@ class StrokeSmoother:
             min_distance: Minimum distance between points
             
         Returns:
-            List of filtered points
+            (n, 2) array of filtered points
         """
         if len(points) < 2:
             return points
-            
-        filtered = [points[0]]
-        
-        for point in points[1:]:
-            last_point = filtered[-1]
-            distance = np.sqrt((point[0] - last_point[0])**2 + (point[1] - last_point[1])**2)
-            
-            if distance >= min_distance:
-                filtered.append(point)
-                
-        return filtered
+
+        pts = np.asarray(points, dtype=np.float64)
+        keep = np.zeros(len(pts), dtype=np.bool_)
+        _dedup_scan(np.ascontiguousarray(pts[:, 0]),
+                    np.ascontiguousarray(pts[:, 1]),
+                    float(min_distance * min_distance), keep)
+
+        return pts[keep]
         
     def douglas_peucker_simplify(self, points, epsilon=2.0):
         """
@@ -237,45 +440,62 @@ class StrokeSmoother:
         """
         if len(points) < 3:
             return points
-            
-        def perpendicular_distance(point, line_start, line_end):
-            """Calculate perpendicular distance from point to line"""
-            if line_start == line_end:
-                return np.sqrt((point[0] - line_start[0])**2 + (point[1] - line_start[1])**2)
-                
-            numerator = abs((line_end[1] - line_start[1]) * point[0] - 
-                          (line_end[0] - line_start[0]) * point[1] + 
-                          line_end[0] * line_start[1] - 
-                          line_end[1] * line_start[0])
-            denominator = np.sqrt((line_end[1] - line_start[1])**2 + 
-                                (line_end[0] - line_start[0])**2)
-            
-            return numerator / denominator
-            
-        def simplify_recursive(pts):
-            """Recursive simplification"""
-            if len(pts) < 3:
-                return pts
-                
-            # Find point with maximum distance
-            max_distance = 0
-            max_index = 0
-            
-            for i in range(1, len(pts) - 1):
-                distance = perpendicular_distance(pts[i], pts[0], pts[-1])
-                if distance > max_distance:
-                    max_distance = distance
-                    max_index = i
-                    
-            # If max distance is greater than epsilon, split
-            if max_distance > epsilon:
-                left = simplify_recursive(pts[:max_index + 1])
-                right = simplify_recursive(pts[max_index:])
-                return left[:-1] + right
+
+        # Iterative formulation: an explicit segment stack replaces
+        # Python recursion (no recursion-limit risk, no list slicing
+        # per level), squared distances against a squared tolerance
+        # remove every sqrt, and the farthest-point scan per segment is
+        # a vectorized argmax
+        pts = np.asarray(points, dtype=np.float64)
+        x, y = pts[:, 0], pts[:, 1]
+        n = len(pts)
+
+        keep = np.zeros(n, dtype=bool)
+        keep[0] = keep[-1] = True
+        epsilon_sq = epsilon * epsilon
+
+        stack = [(0, n - 1)]
+        while stack:
+            s, e = stack.pop()
+            if e - s < 2:
+                continue
+
+            # Cheap acceptance bound: every point's distance to the
+            # segment line is at most its distance to an endpoint, so
+            # if the segment's bounding box is small enough the whole
+            # span is within tolerance without scanning it
+            seg_x = x[s:e + 1]
+            seg_y = y[s:e + 1]
+            bw = seg_x.max() - seg_x.min()
+            bh = seg_y.max() - seg_y.min()
+            if bw * bw + bh * bh <= epsilon_sq:
+                continue
+
+            if _HAVE_NUMBA:
+                # Compiled scan: no temporaries, two multiplies a point
+                split, max_sq = _dp_farthest(x, y, s, e)
             else:
-                return [pts[0], pts[-1]]
-                
-        return simplify_recursive(points)
+                dx = x[e] - x[s]
+                dy = y[e] - y[s]
+                seg_sq = dx * dx + dy * dy
+                xs, ys = x[s + 1:e], y[s + 1:e]
+
+                if seg_sq == 0.0:
+                    # Degenerate segment: distance to the coincident endpoints
+                    dist_sq = (xs - x[s]) ** 2 + (ys - y[s]) ** 2
+                else:
+                    num = dy * xs - dx * ys + x[e] * y[s] - y[e] * x[s]
+                    dist_sq = num * num / seg_sq
+
+                i = int(np.argmax(dist_sq))
+                split, max_sq = s + 1 + i, dist_sq[i]
+
+            if max_sq > epsilon_sq:
+                keep[split] = True
+                stack.append((s, split))
+                stack.append((split, e))
+
+        return pts[keep].astype(np.int32)
         
     def smooth_stroke(self, points, method='savitzky_golay', **kwargs):
         """
@@ -287,7 +507,7 @@ class StrokeSmoother:
             **kwargs: Additional arguments for the smoothing method
             
         Returns:
-            List of smoothed points
+            (n, 2) array of smoothed points
         """
         if len(points) < 2:
             return points
@@ -298,13 +518,13 @@ class StrokeSmoother:
         if len(points) < 2:
             return points
             
-        # Apply selected smoothing method
-        if method in self.smoothing_methods:
-            smoothed = self.smoothing_methods[method](points, **kwargs)
-        else:
-            smoothed = points
-            
-        return smoothed
+        # Apply selected smoothing method via the pre-bound dispatch
+        # table; unknown methods pass through unchanged
+        smoother = self._method_dispatch.get(method)
+        if smoother is None:
+            return points
+
+        return smoother(points, kwargs)
         
     def multi_pass_smooth(self, points, methods=None):
         """
@@ -315,19 +535,34 @@ class StrokeSmoother:
             methods: List of (method_name, kwargs) tuples
             
         Returns:
-            List of smoothed points
+            (n, 2) array of smoothed points
         """
         if methods is None:
-            methods = [
-                ('kalman', {'process_variance': 1e-5, 'measurement_variance': 1e-1}),
-                ('savitzky_golay', {'window_length': 7, 'polyorder': 3}),
-                ('gaussian', {'sigma': 1.5})
-            ]
-            
+            # Default pipeline fast path: the Savitzky-Golay and
+            # Gaussian stages are both linear filters, so they fuse
+            # into one precomputed kernel - a single convolution per
+            # axis instead of two passes with an intermediate array
+            result = self.smooth_stroke(
+                points, method='kalman',
+                process_variance=1e-5, measurement_variance=1e-1
+            )
+
+            if len(result) >= 7:
+                kernel = _fused_sg_gauss_kernel(7, 3, 1.5)
+                arr = np.asarray(result, dtype=np.float32)
+                fused = np.empty_like(arr)
+                fused[:, 0] = convolve1d(arr[:, 0], kernel, mode='nearest')
+                fused[:, 1] = convolve1d(arr[:, 1], kernel, mode='nearest')
+                result = fused.astype(np.int32)
+            elif len(result) >= 2:
+                result = self.smooth_stroke(result, method='gaussian', sigma=1.5)
+
+            return result
+
         result = points
-        
+
         for method_name, kwargs in methods:
             if len(result) >= 2:
                 result = self.smooth_stroke(result, method=method_name, **kwargs)
-                
+
         return result
\ No newline at end of file
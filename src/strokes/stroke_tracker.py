@@ -1,6 +1,7 @@
 
 import numpy as np
 import time
+from scipy.signal import savgol_coeffs
 from src.strokes.stroke_smoothing import StrokeSmoother
 
 class StrokeTracker:
@@ -16,79 +17,163 @@ class StrokeTracker:
             smoothing_method: Smoothing method to use
         """
         self.current_stroke = []
-        self.current_stroke_raw = []  # Store raw points before smoothing
         self.all_strokes = []
         self.is_tracking = False
         self.min_distance_threshold = min_distance_threshold
+        self._min_distance_sq = min_distance_threshold ** 2
         self.last_point = None
         self.stroke_start_time = None
+
+        # Raw points are stored SoA: contiguous int32 x/y arrays grown
+        # by doubling, so accumulation allocates no per-point Python
+        # objects and downstream smoothing gets a vector-friendly layout
+        self._raw_xs = np.empty(1024, dtype=np.int32)
+        self._raw_ys = np.empty(1024, dtype=np.int32)
+        self._raw_len = 0
+        self._raw_cache = None  # Materialized (n, 2) array, built lazily
+
+        # Per-stroke point counts kept as parallel int32 arrays so the
+        # session summary is two C-level sums, not dict-walking passes
+        self._point_counts = np.zeros(1024, dtype=np.int32)
+        self._smoothed_counts = np.zeros(1024, dtype=np.int32)
         
         # Smoothing
         self.enable_smoothing = enable_smoothing
         self.smoothing_method = smoothing_method
         self.smoother = StrokeSmoother()
         self.real_time_smooth = True  # Apply smoothing in real-time
-        
+
+        # Streaming Savitzky-Golay state: endpoint-fit coefficients
+        # cached per window size, and the incrementally built smoothed
+        # stroke in a preallocated int32 array (doubled on overflow),
+        # so each new point costs one dot product per axis and the
+        # preview renderer gets a polyline-ready array with no per-
+        # frame list-to-array conversion
+        self._sg_coeffs_cache = {}
+        self._stream_arr = np.empty((1024, 2), dtype=np.int32)
+        self._stream_len = 0
+
+    def _sg_stream_coeffs(self, window):
+        """Endpoint Savitzky-Golay coefficients for this window size"""
+        coeffs = self._sg_coeffs_cache.get(window)
+        if coeffs is None:
+            coeffs = savgol_coeffs(window, min(3, window - 1),
+                                   pos=window - 1, use='dot')
+            self._sg_coeffs_cache[window] = coeffs
+        return coeffs
+
+    def _stream_point(self, n):
+        """
+        Smoothed estimate of the latest point of an n-point prefix
+
+        Fits the trailing window with the cached endpoint coefficients;
+        short prefixes pass through unsmoothed.
+        """
+        window = min(7, n if n % 2 else n - 1)
+        if window < 5:
+            return (int(self._raw_xs[n - 1]), int(self._raw_ys[n - 1]))
+
+        coeffs = self._sg_stream_coeffs(window)
+        return (float(coeffs @ self._raw_xs[n - window:n]),
+                float(coeffs @ self._raw_ys[n - window:n]))
+
+    def _append_raw(self, point):
+        """Append a point to the SoA raw arrays, doubling on overflow"""
+        n = self._raw_len
+        if n == len(self._raw_xs):
+            self._raw_xs = np.resize(self._raw_xs, n * 2)
+            self._raw_ys = np.resize(self._raw_ys, n * 2)
+        self._raw_xs[n] = point[0]
+        self._raw_ys[n] = point[1]
+        self._raw_len = n + 1
+        self._raw_cache = None
+
+    def _raw_points(self):
+        """Current raw stroke as a (n, 2) int32 array (cached)"""
+        if self._raw_cache is None or len(self._raw_cache) != self._raw_len:
+            self._raw_cache = np.column_stack(
+                (self._raw_xs[:self._raw_len], self._raw_ys[:self._raw_len])
+            )
+        return self._raw_cache
+
     def start_stroke(self, point):
         """
         Start a new stroke
-        
+
         Args:
             point: (x, y) starting point
         """
         self.current_stroke = [point]
-        self.current_stroke_raw = [point]
+        self._raw_len = 0
+        self._raw_cache = None
+        self._stream_len = 0
+        self._append_raw(point)
         self.is_tracking = True
         self.last_point = point
         self.stroke_start_time = time.time()
-        
+
     def add_point(self, point):
         """
         Add a point to current stroke if far enough from last point
-        
+
         Args:
             point: (x, y) point to add
-            
+
         Returns:
             bool: True if point was added, False otherwise
         """
         if not self.is_tracking:
             return False
-            
-        if self.last_point is None:
-            self.current_stroke_raw.append(point)
+
+        if self._raw_len == 0:
+            self._append_raw(point)
             self.last_point = point
             self._update_smoothed_stroke()
             return True
-            
-        # Calculate distance from last point
-        distance = np.sqrt(
-            (point[0] - self.last_point[0])**2 + 
-            (point[1] - self.last_point[1])**2
-        )
-        
+
+        # Squared distance from last point - pure int arithmetic, no
+        # sqrt needed to compare against the pre-squared threshold
+        last = self._raw_len - 1
+        dx = int(point[0]) - int(self._raw_xs[last])
+        dy = int(point[1]) - int(self._raw_ys[last])
+
         # Only add if moved enough (reduces jitter)
-        if distance >= self.min_distance_threshold:
-            self.current_stroke_raw.append(point)
+        if dx * dx + dy * dy >= self._min_distance_sq:
+            self._append_raw(point)
             self.last_point = point
             self._update_smoothed_stroke()
             return True
-            
+
         return False
-        
+
     def _update_smoothed_stroke(self):
         """Update the smoothed version of current stroke"""
-        if self.enable_smoothing and self.real_time_smooth and len(self.current_stroke_raw) > 3:
-            # Apply real-time smoothing
+        if not (self.enable_smoothing and self.real_time_smooth and self._raw_len > 3):
+            self.current_stroke = self._raw_points()
+            return
+
+        if self.smoothing_method == 'savitzky_golay':
+            # Streaming path: extend the smoothed stroke with endpoint
+            # fits only for points not smoothed yet (normally just one;
+            # the catch-up loop only runs after a mid-stroke method
+            # switch), O(window) per point instead of O(n)
+            while self._stream_len < self._raw_len:
+                n = self._stream_len
+                if n == len(self._stream_arr):
+                    self._stream_arr = np.resize(self._stream_arr, (n * 2, 2))
+                self._stream_arr[n] = self._stream_point(n + 1)
+                self._stream_len = n + 1
+            self.current_stroke = self._stream_arr[:self._stream_len]
+        else:
+            # Other methods have no streaming form - re-filter the
+            # whole stroke
             self.current_stroke = self.smoother.smooth_stroke(
-                self.current_stroke_raw,
+                self._raw_points(),
                 method=self.smoothing_method,
-                window_length=min(7, len(self.current_stroke_raw)),
-                polyorder=min(3, len(self.current_stroke_raw) - 1)
+                window_length=min(7, self._raw_len),
+                polyorder=min(3, self._raw_len - 1)
             )
-        else:
-            self.current_stroke = self.current_stroke_raw.copy()
-        
+
     def end_stroke(self):
         """
         End current stroke and save it
@@ -100,31 +185,48 @@ class StrokeTracker:
             return None
             
         self.is_tracking = False
-        
+
         # Only save strokes with enough points
-        if len(self.current_stroke_raw) >= 3:
-            # Apply final smoothing pass
+        if self._raw_len >= 3:
+            raw_points = self._raw_points().copy()
+
+            # Apply final smoothing pass. Copy the result: the smoother
+            # may hand back a view into its reusable scratch, and this
+            # stroke outlives the next smoothing call.
             if self.enable_smoothing:
-                smoothed_points = self.smoother.multi_pass_smooth(self.current_stroke_raw)
+                smoothed_points = np.array(self.smoother.multi_pass_smooth(raw_points))
             else:
-                smoothed_points = self.current_stroke_raw.copy()
-            
+                smoothed_points = raw_points
+
             stroke_data = {
                 'points': smoothed_points,
-                'raw_points': self.current_stroke_raw.copy(),
+                # Render-ready polyline array, converted once here so
+                # redraws never re-cross the Python/C boundary per point
+                'np_pts': np.asarray(smoothed_points, dtype=np.int32).reshape(-1, 1, 2),
+                'raw_points': raw_points,
                 'timestamp': self.stroke_start_time,
                 'duration': time.time() - self.stroke_start_time,
-                'point_count': len(self.current_stroke_raw),
+                'point_count': len(raw_points),
                 'smoothed_count': len(smoothed_points)
             }
+            n = len(self.all_strokes)
+            if n == len(self._point_counts):
+                self._point_counts = np.resize(self._point_counts, n * 2)
+                self._smoothed_counts = np.resize(self._smoothed_counts, n * 2)
+            self._point_counts[n] = len(raw_points)
+            self._smoothed_counts[n] = len(smoothed_points)
+
             self.all_strokes.append(stroke_data)
-            completed_stroke = smoothed_points.copy()
             self.current_stroke = []
-            self.current_stroke_raw = []
-            return completed_stroke
-            
+            self._raw_len = 0
+            self._raw_cache = None
+            self._stream_len = 0
+            return smoothed_points
+
         self.current_stroke = []
-        self.current_stroke_raw = []
+        self._raw_len = 0
+        self._raw_cache = None
+        self._stream_len = 0
         return None
         
     def get_current_stroke(self):
@@ -138,7 +240,9 @@ class StrokeTracker:
     def clear_all_strokes(self):
         """Clear all strokes"""
         self.current_stroke = []
-        self.current_stroke_raw = []
+        self._raw_len = 0
+        self._raw_cache = None
+        self._stream_len = 0
         self.all_strokes = []
         self.is_tracking = False
         self.last_point = None
@@ -152,14 +256,25 @@ class StrokeTracker:
     def get_stroke_count(self):
         """Get number of completed strokes"""
         return len(self.all_strokes)
+
+    def get_point_totals(self):
+        """
+        Get total raw and smoothed point counts across all strokes
+
+        Returns:
+            tuple: (total_raw_points, total_smoothed_points)
+        """
+        n = len(self.all_strokes)
+        return (int(self._point_counts[:n].sum()),
+                int(self._smoothed_counts[:n].sum()))
         
     def is_drawing(self):
         """Check if currently drawing"""
         return self.is_tracking
         
     def get_raw_stroke(self):
-        """Get current raw (unsmoothed) stroke"""
-        return self.current_stroke_raw
+        """Get current raw (unsmoothed) stroke as a (n, 2) array"""
+        return self._raw_points()
         
     def toggle_smoothing(self):
         """Toggle smoothing on/off"""
@@ -173,7 +288,7 @@ class StrokeTracker:
         Args:
             method: One of 'moving_average', 'gaussian', 'savitzky_golay', 'spline', 'kalman'
         """
-        if method in self.smoother.smoothing_methods:
+        if method in self.smoother.SMOOTHING_METHODS:
             self.smoothing_method = method
             return True
         return False
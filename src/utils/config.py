@@ -11,6 +11,11 @@ MIN_DETECTION_CONFIDENCE = 0.7
 MIN_TRACKING_CONFIDENCE = 0.5
 MAX_NUM_HANDS = 1
 
+# Inference resolution (frames are downscaled before MediaPipe;
+# landmarks are normalized so display coordinates are unaffected)
+INFERENCE_WIDTH = 640
+INFERENCE_HEIGHT = 360
+
 # Display settings
 WINDOW_NAME = "Air Writing - Phase 3: Stroke Smoothing"
 LANDMARK_DRAW_SPEC_COLOR = (0, 255, 0)  # Green